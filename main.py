@@ -1,23 +1,224 @@
-import requests
-import time
-from typing import List, Dict, Optional
+import asyncio
+import contextlib
+import heapq
+import aiohttp
+from cachetools import TTLCache
+from shelved_cache import PersistentCache
+from typing import AsyncIterator, BinaryIO, List, Dict, NamedTuple, Optional, Tuple
 import json
+import orjson
+import shelve
+import sys
+import time
+from urllib.parse import urlencode
+
+# Seconds a cached anime details response stays valid
+DETAILS_TTL = 3600
+
+def _purge_expired_details(cache: PersistentCache):
+    """
+    Drop cached details older than DETAILS_TTL
+    
+    shelved_cache reloads every stored row into a TTLCache with a fresh timer,
+    so entries left by earlier runs have to be aged by their stored timestamp.
+    Works on the wrapped TTLCache, whose keys are the real anime IDs;
+    iterating the PersistentCache itself yields the shelf's hashed string keys.
+    """
+    # The shelf is loaded lazily, and reading .wrapped does not trigger it
+    cache.initialize_if_not_initialized()
+    now = time.time()
+    for anime_id, entry in list(cache.wrapped.items()):
+        if not isinstance(entry, tuple) or now - entry[0] > DETAILS_TTL:
+            # Deleting from the wrapped cache also removes the shelf row;
+            # PersistentCache.__delitem__ expects the hashed key instead
+            del cache.wrapped[anime_id]
+
+def open_details_cache(filename: Optional[str] = None) -> PersistentCache:
+    """
+    Open the on-disk details cache and drop entries left over from old runs
+    
+    Args:
+        filename: Cache file, defaults to DETAILS_CACHE_FILE
+        
+    Returns:
+        Open PersistentCache; the caller must close it
+    """
+    cache = PersistentCache(TTLCache, filename or DETAILS_CACHE_FILE,
+                            maxsize=10000, ttl=DETAILS_TTL)
+    try:
+        _purge_expired_details(cache)
+    except Exception:
+        cache.close()
+        raise
+    return cache
+
+# On-disk caches, opened for the duration of each MAL run
+DETAILS_CACHE_FILE = 'mal_details.db'
+ETAG_CACHE_FILE = 'mal_etags'
+
+class AnimeRecord(NamedTuple):
+    """A qualified anime from the MAL ranking"""
+    id: int
+    title: str
+    score: float
+    votes_10: int
+    total_ratings: int
+    rank: int
+    popularity: int
+    rating: str
+
+def count_10_votes(scores: List[Dict]) -> int:
+    """
+    Count the "10" votes in a rating distribution
+    
+    Args:
+        scores: Score buckets as returned by the API, normally ordered 1..10
+        
+    Returns:
+        Number of "10" votes, or 0 if there is no "10" bucket
+    """
+    if scores and scores[-1]['score'] == 10:
+        return scores[-1]['votes']
+    # Distribution not in the usual order, fall back to a scan
+    return next((s['votes'] for s in scores if s['score'] == 10), 0)
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 class MALAnimeFinder:
-    def __init__(self, client_id: str):
+    def __init__(self, client_id: str, max_concurrency: int = 20):
         """
         Initialize the MAL API client
         
         Args:
             client_id: Your MyAnimeList API Client ID
+            max_concurrency: Maximum number of requests in flight at once
         """
         self.client_id = client_id
         self.base_url = "https://api.myanimelist.net/v2"
         self.headers = {
             'X-MAL-CLIENT-ID': client_id
         }
+        self.max_concurrency = max_concurrency
+        # Created per run in find_top_anime_with_high_10_ratings
+        self.session: Optional[aiohttp.ClientSession] = None
+        # In-flight ranking page fetches, keyed by page number
+        self._prefetched: Dict[int, asyncio.Task] = {}
+        
+        # Disk caches, also opened per run. Details are stored as
+        # (fetched_at, details) under the int anime ID: shelved_cache keys rows
+        # by str(hash(key)), which is only stable across processes for ints.
+        self._details_cache: Optional[PersistentCache] = None
+        # (ETag, raw body) of the last 200 response per ranking page URL, so
+        # reruns can send If-None-Match and reuse the body when MAL answers 304
+        self._etag_cache: Optional[shelve.Shelf] = None
+        
+        # Admission control for MAL requests. The limit shrinks when MAL
+        # answers 429 and grows back after a streak of 2xx/304 responses.
+        self._in_flight = 0
+        self._concurrency_limit = max_concurrency
+        self._success_streak = 0
+        self._cond = asyncio.Condition()
+    
+    async def _acquire_slot(self):
+        """Wait until a request slot is free under the current concurrency limit"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self._concurrency_limit)
+            self._in_flight += 1
+    
+    async def _release_slot(self, outcome: str = 'neutral'):
+        """
+        Release a request slot and adapt the concurrency limit
+        
+        Args:
+            outcome: 'success' for a 2xx/304 response, 'throttled' for HTTP 429,
+                'neutral' for anything else (errors neither raise nor lower the limit)
+        """
+        async with self._cond:
+            self._in_flight -= 1
+            if outcome == 'throttled':
+                self._concurrency_limit = max(1, self._concurrency_limit - 1)
+                self._success_streak = 0
+            elif outcome == 'success':
+                self._success_streak += 1
+                if (self._success_streak >= self._concurrency_limit and
+                        self._concurrency_limit < self.max_concurrency):
+                    self._concurrency_limit += 1
+                    self._success_streak = 0
+                    # Several waiters may now fit under the raised limit
+                    self._cond.notify_all()
+            self._cond.notify(1)
+    
+    @staticmethod
+    def _parse_retry_after(response: aiohttp.ClientResponse, default: float = 1.0) -> float:
+        """Read the Retry-After header in seconds, falling back to a default"""
+        try:
+            return float(response.headers.get('Retry-After', default))
+        except ValueError:
+            # HTTP-date form is not worth parsing here
+            return default
+    
+    async def _get_json(self, url: str, params: Optional[Dict] = None,
+                        max_attempts: int = 5, backoff_factor: float = 0.5,
+                        conditional: bool = False):
+        """
+        GET a MAL endpoint over the shared keep-alive session and decode the body
         
-    def search_top_anime(self, limit: int = 500, offset: int = 0) -> List[Dict]:
+        Retryable statuses, connection errors and timeouts are retried with
+        exponential backoff, honouring Retry-After when MAL sends it. With
+        conditional set, the request is made conditional on the last seen
+        ETag, and a 304 response reuses the stored body.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            max_attempts: Total number of tries before giving up
+            backoff_factor: Base delay in seconds, doubled after each retry
+            conditional: Store the ETag and body and revalidate on later calls;
+                only used for ranking pages, as details have their own cache
+            
+        Returns:
+            Decoded JSON body
+            
+        Raises:
+            aiohttp.ClientError: On non-retryable statuses, or a retryable
+                status or connection error on the final attempt
+            asyncio.TimeoutError: If the final attempt times out
+            orjson.JSONDecodeError: If the body is not valid JSON
+        """
+        cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        cached = self._etag_cache.get(cache_key) if conditional else None
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        for attempt in range(max_attempts):
+            await self._acquire_slot()
+            outcome = 'neutral'
+            try:
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    if response.status == 429:
+                        outcome = 'throttled'
+                    if response.status == 304 and cached:
+                        outcome = 'success'
+                        return orjson.loads(cached[1])
+                    if response.status not in RETRY_STATUSES or attempt == max_attempts - 1:
+                        response.raise_for_status()
+                        body = await response.read()
+                        outcome = 'success'
+                        data = orjson.loads(body)
+                        if conditional and 'ETag' in response.headers:
+                            self._etag_cache[cache_key] = (response.headers['ETag'], body)
+                        return data
+                    delay = self._parse_retry_after(response, backoff_factor * 2 ** attempt)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == max_attempts - 1:
+                    raise
+                delay = backoff_factor * 2 ** attempt
+            finally:
+                await self._release_slot(outcome)
+            
+            await asyncio.sleep(delay)
+        
+    async def search_top_anime(self, limit: int = 500, offset: int = 0) -> List[Dict]:
         """
         Search for top anime sorted by score
         
@@ -34,18 +235,16 @@ class MALAnimeFinder:
             'ranking_type': 'all',  # Get all anime sorted by score
             'limit': limit,
             'offset': offset,
-            'fields': 'id,title,main_picture,mean,rank,popularity,num_scoring_users,rating'
+            'fields': 'id,title,main_picture,mean,rank,popularity,num_scoring_users,rating,statistics'
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()['data']
-        except requests.exceptions.RequestException as e:
+            return (await self._get_json(url, params, conditional=True))['data']
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
             print(f"Error fetching data: {e}")
             return []
     
-    def get_anime_details(self, anime_id: int) -> Optional[Dict]:
+    async def get_anime_details(self, anime_id: int) -> Optional[Dict]:
         """
         Get detailed information for a specific anime including rating distribution
         
@@ -55,6 +254,10 @@ class MALAnimeFinder:
         Returns:
             Anime details with rating distribution
         """
+        cached = self._details_cache.get(anime_id)
+        if cached and time.time() - cached[0] <= DETAILS_TTL:
+            return cached[1]
+        
         url = f"{self.base_url}/anime/{anime_id}"
         
         params = {
@@ -62,15 +265,82 @@ class MALAnimeFinder:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            details = await self._get_json(url, params)
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
             print(f"Error fetching anime {anime_id}: {e}")
             return None
+        
+        self._details_cache[anime_id] = (time.time(), details)
+        return details
+    
+    async def iter_top_anime(self, limit: int = 500, pages: int = 5) -> AsyncIterator[Dict]:
+        """
+        Yield ranking nodes one page at a time, with every page fetched concurrently
+        
+        Args:
+            limit: Anime per page (max 500)
+            pages: Maximum number of pages to fetch
+            
+        Yields:
+            Anime node dicts from the ranking endpoint
+        """
+        # Pages are independent, so request them all up front; admission
+        # control and the connector limit keep the burst bounded
+        print(f"Fetching {pages} pages...")
+        for page in range(pages):
+            self._prefetched[page] = asyncio.create_task(
+                self.search_top_anime(limit=limit, offset=page * limit)
+            )
+        
+        try:
+            for page in range(pages):
+                anime_batch = await self._prefetched.pop(page)
+                
+                # An empty page means the ranking ran out (or failed); later
+                # pages are cancelled below
+                if not anime_batch:
+                    break
+                
+                for anime_item in anime_batch:
+                    yield anime_item['node']
+        finally:
+            # Don't leave a prefetch running if the consumer stops early
+            for task in self._prefetched.values():
+                task.cancel()
+            self._prefetched.clear()
+    
+    @staticmethod
+    def _to_record(anime: Dict, min_10_ratings: int) -> Optional[AnimeRecord]:
+        """Build an AnimeRecord if the anime has enough "10" ratings"""
+        stats = anime.get('statistics')
+        if not stats or 'scores' not in stats:
+            return None
+        
+        votes_10 = count_10_votes(stats['scores'])
+        if votes_10 < min_10_ratings:
+            return None
+        
+        return AnimeRecord(
+            id=anime['id'],
+            title=anime['title'],
+            score=anime['mean'],
+            votes_10=votes_10,
+            total_ratings=anime.get('num_scoring_users', 0),
+            rank=anime.get('rank', 0),
+            popularity=anime.get('popularity', 0),
+            rating=anime.get('rating', 'N/A')
+        )
+    
+    async def _to_record_with_details(self, anime: Dict, min_10_ratings: int) -> Optional[AnimeRecord]:
+        """Like _to_record, but takes the rating distribution from the details endpoint"""
+        details = await self.get_anime_details(anime['id'])
+        if details and 'statistics' in details:
+            anime['statistics'] = details['statistics']
+        return self._to_record(anime, min_10_ratings)
     
-    def find_top_anime_with_high_10_ratings(self, min_10_ratings: int = 35, top_n: int = 100, 
-                                            min_score: float = 0.0, min_users: int = 1000) -> List[Dict]:
+    async def find_top_anime_with_high_10_ratings(self, min_10_ratings: int = 35, top_n: int = 100, 
+                                            min_score: float = 0.0, min_users: int = 1000,
+                                            stream_file: Optional[str] = None) -> List[AnimeRecord]:
         """
         Find top anime with high scores and minimum number of 10 ratings
         
@@ -79,83 +349,111 @@ class MALAnimeFinder:
             top_n: Number of top anime to return
             min_score: Minimum average score threshold
             min_users: Minimum number of users who rated
+            stream_file: Optional NDJSON file each qualified anime is written to as it is found
             
         Returns:
             List of anime sorted by score
         """
-        all_anime = []
-        offset = 0
-        limit = 500
-        
-        print("Fetching top anime from MAL...")
-        
-        # Fetch multiple pages to get enough anime
-        for page in range(5):  # Get up to 2500 anime
-            print(f"Fetching page {page + 1}...")
-            anime_batch = self.search_top_anime(limit=limit, offset=offset)
-            
-            if not anime_batch:
-                break
+        try:
+            # Everything opened so far is closed even if a later open fails
+            with contextlib.ExitStack() as stack:
+                stream = stack.enter_context(open(stream_file, 'wb')) if stream_file else None
+                self._details_cache = open_details_cache()
+                stack.callback(self._details_cache.close)
+                self._etag_cache = stack.enter_context(shelve.open(ETAG_CACHE_FILE))
                 
-            all_anime.extend(anime_batch)
-            offset += limit
-            
-            # Be respectful to the API
-            time.sleep(0.5)
+                # One session for the whole run so every request reuses pooled
+                # keep-alive connections; the pool is capped at the admission ceiling
+                connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=30)
+                
+                async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+                    self.session = session
+                    return await self._find_top_anime(min_10_ratings, top_n, min_score,
+                                                      min_users, stream)
+        finally:
+            self.session = None
+            self._details_cache = None
+            self._etag_cache = None
+    
+    async def _find_top_anime(self, min_10_ratings: int, top_n: int, min_score: float,
+                              min_users: int, stream: Optional[BinaryIO]) -> List[AnimeRecord]:
+        """Body of find_top_anime_with_high_10_ratings, run inside an open session"""
+        # Deliberately lossy: anime without statistics in the ranking payload
+        # only get a detail request if they have min_10_ratings * 50 scoring
+        # users, i.e. would qualify with a 2% share of "10" votes. Top-ranked
+        # anime often exceed that share, so with min_users below this
+        # threshold some qualifying fallback anime are skipped. Anime whose
+        # statistics arrived with the ranking are never affected.
+        threshold_users = max(min_users, min_10_ratings * 50)
         
-        print(f"Total anime fetched: {len(all_anime)}")
-        print("Fetching rating distributions...")
+        # Min-heap of (score, -order, record) holding the best top_n so far,
+        # where order is the anime's position in the ranking stream; -order
+        # makes higher-ranked anime win ties even if their record arrives
+        # later from a fallback detail request
+        top_heap: List[Tuple[float, int, AnimeRecord]] = []
+        qualified = 0
+        fetched = 0
+        checked = 0
+        skipped = 0
+        detail_tasks = []
+        detail_orders = []
         
-        qualified_anime = []
+        def keep(record: Optional[AnimeRecord], order: int):
+            nonlocal qualified
+            if record is None:
+                return
+            qualified += 1
+            if stream:
+                stream.write(orjson.dumps(record._asdict()) + b'\n')
+            item = (record.score, -order, record)
+            if len(top_heap) < top_n:
+                heapq.heappush(top_heap, item)
+            else:
+                heapq.heappushpop(top_heap, item)
+        
+        print("Fetching top anime from MAL...")
         
-        # Check each anime for rating distribution
-        for i, anime_item in enumerate(all_anime):
-            anime = anime_item['node']
+        async for anime in self.iter_top_anime():
+            fetched += 1
             
             # Skip if no mean score or too few users
-            if ('mean' not in anime or anime['mean'] is None or 
-                anime['mean'] < min_score or 
-                'num_scoring_users' not in anime or 
-                anime['num_scoring_users'] < min_users):
+            if anime.get('mean') is None or anime['mean'] < min_score:
+                continue
+            if anime.get('num_scoring_users', 0) < min_users:
                 continue
             
-            # Get detailed statistics
-            details = self.get_anime_details(anime['id'])
-            
-            if details and 'statistics' in details:
-                stats = details['statistics']
-                if 'scores' in stats:
-                    # Find the count of "10" ratings
-                    for score_data in stats['scores']:
-                        if score_data['score'] == 10:
-                            if score_data['votes'] >= min_10_ratings:
-                                qualified_anime.append({
-                                    'id': anime['id'],
-                                    'title': anime['title'],
-                                    'score': anime['mean'],
-                                    '10_ratings': score_data['votes'],
-                                    'total_ratings': anime.get('num_scoring_users', 0),
-                                    'rank': anime.get('rank', 0),
-                                    'popularity': anime.get('popularity', 0),
-                                    'rating': anime.get('rating', 'N/A'),
-                                    'statistics': stats
-                                })
-                            break
-            
-            # Progress indicator
-            if (i + 1) % 50 == 0:
-                print(f"Processed {i + 1} anime... Found {len(qualified_anime)} qualified")
-            
-            # Rate limiting
-            time.sleep(0.1)
+            # The ranking call already requests statistics; only fall back to a
+            # detail request for entries that came back without a distribution
+            if 'scores' in (anime.get('statistics') or {}):
+                checked += 1
+                keep(self._to_record(anime, min_10_ratings), fetched)
+            elif anime['num_scoring_users'] < threshold_users:
+                skipped += 1
+            else:
+                checked += 1
+                detail_tasks.append(asyncio.create_task(
+                    self._to_record_with_details(anime, min_10_ratings)
+                ))
+                detail_orders.append(fetched)
         
-        # Sort by score (highest first)
-        qualified_anime.sort(key=lambda x: x['score'], reverse=True)
+        print(f"Total anime fetched: {fetched}")
+        print(f"Skipped detail requests for {skipped} anime with fewer than "
+              f"{threshold_users:,} scoring users")
+        
+        if detail_tasks:
+            # Detail requests started while later pages were loading; admission
+            # control keeps them bounded
+            print(f"Fetching rating distributions for {len(detail_tasks)} anime...")
+            records = await asyncio.gather(*detail_tasks)
+            for record, order in zip(records, detail_orders):
+                keep(record, order)
         
-        # Return top N
-        return qualified_anime[:top_n]
+        print(f"Processed {checked} anime... Found {qualified} qualified")
+        
+        # Return top N by score (highest first)
+        return [record for _, _, record in sorted(top_heap, reverse=True)]
     
-    def save_results(self, anime_list: List[Dict], filename: str = "top_anime_results.json"):
+    def save_results(self, anime_list: List[AnimeRecord], filename: str = "top_anime_results.json"):
         """
         Save results to JSON file
         
@@ -163,11 +461,11 @@ class MALAnimeFinder:
             anime_list: List of anime data
             filename: Output filename
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(anime_list, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps([anime._asdict() for anime in anime_list]))
         print(f"Results saved to {filename}")
     
-    def print_results(self, anime_list: List[Dict], max_display: int = 20):
+    def print_results(self, anime_list: List[AnimeRecord], max_display: int = 20):
         """
         Print results in a readable format
         
@@ -175,19 +473,26 @@ class MALAnimeFinder:
             anime_list: List of anime data
             max_display: Maximum number of results to display
         """
-        print("\n" + "="*100)
-        print(f"TOP {len(anime_list)} ANIME WITH HIGHEST SCORES (Minimum 35 '10' Ratings)")
-        print("="*100)
+        lines = [
+            "\n" + "="*100,
+            f"TOP {len(anime_list)} ANIME WITH HIGHEST SCORES (Minimum 35 '10' Ratings)",
+            "="*100
+        ]
         
-        for i, anime in enumerate(anime_list[:max_display], 1):
-            print(f"\n{i:3d}. {anime['title']}")
-            print(f"     Score: {anime['score']:.2f} | 10 Ratings: {anime['10_ratings']:,} | "
-                  f"Total Ratings: {anime['total_ratings']:,}")
-            print(f"     Rank: #{anime.get('rank', 'N/A')} | Popularity: #{anime.get('popularity', 'N/A')} | "
-                  f"Rating: {anime.get('rating', 'N/A')}")
+        lines.extend(
+            f"\n{i:3d}. {anime.title}\n"
+            f"     Score: {anime.score:.2f} | 10 Ratings: {anime.votes_10:,} | "
+            f"Total Ratings: {anime.total_ratings:,}\n"
+            f"     Rank: #{anime.rank} | Popularity: #{anime.popularity} | "
+            f"Rating: {anime.rating}"
+            for i, anime in enumerate(anime_list[:max_display], 1)
+        )
         
         if len(anime_list) > max_display:
-            print(f"\n... and {len(anime_list) - max_display} more")
+            lines.append(f"\n... and {len(anime_list) - max_display} more")
+        
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 # Alternative approach using Jikan API (Unofficial but more comprehensive)
 class JikanAnimeFinder:
@@ -196,13 +501,35 @@ class JikanAnimeFinder:
     This might have more detailed rating distribution data
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 3):
+        """
+        Initialize the Jikan API client
+        
+        Args:
+            max_concurrency: Maximum number of requests started per second
+                (Jikan allows 3 requests/second)
+        """
         self.base_url = "https://api.jikan.moe/v4"
         self.headers = {
             'User-Agent': 'MAL Top Anime Finder/1.0'
         }
+        # Created per run in find_top_anime_with_high_10_ratings
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _get_data(self, url: str, params: Optional[Dict] = None):
+        """GET a Jikan endpoint under the rate limit and return its 'data' field"""
+        async with self._semaphore:
+            try:
+                async with self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())['data']
+            finally:
+                # Hold the slot for a second so no more than max_concurrency
+                # requests start per second
+                await asyncio.sleep(1)
     
-    def get_top_anime(self, page: int = 1, limit: int = 25) -> List[Dict]:
+    async def get_top_anime(self, page: int = 1, limit: int = 25) -> List[Dict]:
         """Get top anime from Jikan API"""
         url = f"{self.base_url}/top/anime"
         params = {
@@ -211,27 +538,81 @@ class JikanAnimeFinder:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()['data']
+            return await self._get_data(url, params)
         except Exception as e:
             print(f"Error: {e}")
             return []
     
-    def get_anime_statistics(self, mal_id: int) -> Optional[Dict]:
+    async def get_anime_statistics(self, mal_id: int) -> Optional[Dict]:
         """Get statistics for a specific anime"""
         url = f"{self.base_url}/anime/{mal_id}/statistics"
         
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()['data']
+            return await self._get_data(url)
         except Exception as e:
             print(f"Error getting stats for {mal_id}: {e}")
             return None
+    
+    async def find_top_anime_with_high_10_ratings(self, min_10_ratings: int = 35,
+                                                  pages: int = 10, limit: int = 25) -> List[Dict]:
+        """
+        Find top anime with a minimum number of 10 ratings
+        
+        Args:
+            min_10_ratings: Minimum number of "10" ratings required
+            pages: Number of top anime pages to check
+            limit: Anime per page (max 25)
+            
+        Returns:
+            List of anime sorted by score
+        """
+        qualified_anime = []
+        
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            self.session = session
+            try:
+                next_page = asyncio.create_task(self.get_top_anime(page=1, limit=limit))
+                
+                for page in range(1, pages + 1):
+                    print(f"Checking page {page}...")
+                    anime_list = await next_page
+                    
+                    # Fetch the next page while this page's statistics load
+                    if page < pages:
+                        next_page = asyncio.create_task(self.get_top_anime(page=page + 1, limit=limit))
+                    
+                    # All statistics calls go out together; the semaphore paces them
+                    all_stats = await asyncio.gather(
+                        *[self.get_anime_statistics(anime['mal_id']) for anime in anime_list]
+                    )
+                    
+                    for anime, stats in zip(anime_list, all_stats):
+                        try:
+                            if stats and 'scores' in stats:
+                                votes_10 = count_10_votes(stats['scores'])
+                                if votes_10 >= min_10_ratings:
+                                    qualified_anime.append({
+                                        'title': anime['title'],
+                                        'score': anime['score'],
+                                        '10_ratings': votes_10,
+                                        'total_ratings': stats['total'],
+                                        'url': anime['url'],
+                                        'episodes': anime.get('episodes', 'N/A'),
+                                        'status': anime.get('status', 'N/A')
+                                    })
+                        except Exception as e:
+                            print(f"Error processing {anime.get('title', 'Unknown')}: {e}")
+                            continue
+            finally:
+                self.session = None
+        
+        # Sort by score
+        qualified_anime.sort(key=lambda x: x['score'], reverse=True)
+        
+        return qualified_anime
 
 
-def main():
+async def main():
     """
     Main function to run the anime finder
     """
@@ -257,11 +638,12 @@ def main():
         
         # Find top 100 anime with minimum 35 "10" ratings
         print("\nSearching for top anime with at least 35 '10' ratings...")
-        top_anime = finder.find_top_anime_with_high_10_ratings(
+        top_anime = await finder.find_top_anime_with_high_10_ratings(
             min_10_ratings=35,
             top_n=100,
             min_score=7.0,  # Minimum score threshold
-            min_users=5000   # Minimum number of users who rated
+            min_users=5000,  # Minimum number of users who rated
+            stream_file="mal_qualified_anime.jsonl"  # Every qualified anime, as found
         )
         
         # Print and save results
@@ -270,8 +652,8 @@ def main():
             finder.save_results(top_anime, "mal_top_anime.json")
             
             # Summary statistics
-            avg_score = sum(a['score'] for a in top_anime) / len(top_anime)
-            avg_10_ratings = sum(a['10_ratings'] for a in top_anime) / len(top_anime)
+            avg_score = sum(a.score for a in top_anime) / len(top_anime)
+            avg_10_ratings = sum(a.votes_10 for a in top_anime) / len(top_anime)
             print(f"\nSUMMARY:")
             print(f"Average Score: {avg_score:.2f}")
             print(f"Average '10' Ratings per Anime: {avg_10_ratings:,.0f}")
@@ -285,43 +667,13 @@ def main():
         print("Note: This method might be slower due to rate limiting.")
         
         jikan_finder = JikanAnimeFinder()
-        qualified_anime = []
         
         # Jikan has rate limits (60 requests/minute, 3 requests/second)
-        # We'll be conservative
-        pages_to_check = 10  # 10 pages * 25 items = 250 anime
-        
-        for page in range(1, pages_to_check + 1):
-            print(f"Checking page {page}...")
-            anime_list = jikan_finder.get_top_anime(page=page, limit=25)
-            
-            for anime in anime_list:
-                try:
-                    stats = jikan_finder.get_anime_statistics(anime['mal_id'])
-                    
-                    if stats and 'scores' in stats:
-                        for score in stats['scores']:
-                            if score['score'] == 10 and score['votes'] >= 35:
-                                qualified_anime.append({
-                                    'title': anime['title'],
-                                    'score': anime['score'],
-                                    '10_ratings': score['votes'],
-                                    'total_ratings': stats['total'],
-                                    'url': anime['url'],
-                                    'episodes': anime.get('episodes', 'N/A'),
-                                    'status': anime.get('status', 'N/A')
-                                })
-                                break
-                    
-                    # Rate limiting
-                    time.sleep(0.34)  # ~3 requests per second
-                    
-                except Exception as e:
-                    print(f"Error processing {anime.get('title', 'Unknown')}: {e}")
-                    continue
-        
-        # Sort by score
-        qualified_anime.sort(key=lambda x: x['score'], reverse=True)
+        # 10 pages * 25 items = 250 anime
+        qualified_anime = await jikan_finder.find_top_anime_with_high_10_ratings(
+            min_10_ratings=35,
+            pages=10
+        )
         
         # Print results
         print("\n" + "="*100)
@@ -343,4 +695,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,68 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+try:
+    import main
+except ImportError:  # aiohttp, cachetools or shelved_cache not installed
+    main = None
+
+
+@unittest.skipIf(main is None, "main.py dependencies are not installed")
+class DetailsCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'details.db')
+
+    def test_fresh_entry_survives_reruns(self):
+        cache = main.open_details_cache(self.filename)
+        cache[5114] = (time.time(), {'id': 5114})
+        cache.close()
+
+        for _ in range(2):
+            cache = main.open_details_cache(self.filename)
+            self.assertEqual(cache.get(5114)[1], {'id': 5114})
+            self.assertEqual(len(cache), 1)
+            cache.close()
+
+    def test_expired_entry_is_dropped_on_open(self):
+        cache = main.open_details_cache(self.filename)
+        cache[5114] = (time.time() - main.DETAILS_TTL - 1, {'id': 5114})
+        cache.close()
+
+        cache = main.open_details_cache(self.filename)
+        self.assertIsNone(cache.get(5114))
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+
+
+@unittest.skipIf(main is None, "main.py dependencies are not installed")
+class FindTopAnimeTest(unittest.TestCase):
+    def test_fallback_anime_keeps_ranking_order_on_ties(self):
+        scores = [{'score': 10, 'votes': 100}]
+        ranking = [
+            {'node': {'id': 1, 'title': 'rank1', 'mean': 9.0, 'num_scoring_users': 10000}},
+            {'node': {'id': 2, 'title': 'rank2', 'mean': 9.0, 'num_scoring_users': 10000,
+                      'statistics': {'scores': scores}}},
+        ]
+
+        async def search_top_anime(limit=500, offset=0):
+            return ranking if offset == 0 else []
+
+        async def get_anime_details(anime_id):
+            return {'statistics': {'scores': scores}}
+
+        finder = main.MALAnimeFinder('client-id')
+        finder.search_top_anime = search_top_anime
+        finder.get_anime_details = get_anime_details
+
+        top = asyncio.run(finder._find_top_anime(35, 1, 0.0, 1000, None))
+        self.assertEqual([record.id for record in top], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()